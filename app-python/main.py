@@ -2,7 +2,7 @@
 DevOps Assessment API - High-Performance Version with Write Decoupling
 
 Key optimizations:
-1. Redis Streams as message queue for write decoupling
+1. Redis list as message queue for write decoupling
 2. Background write workers process writes asynchronously
 3. Aggressive read caching (longer TTL, minimal invalidation)
 4. Write coalescing - batch multiple writes together
@@ -12,20 +12,22 @@ Key optimizations:
 
 import os
 import time
-import random
-import string
 import asyncio
-import json
-import hashlib
-from datetime import datetime
-from typing import Optional, List, Dict, Any, Set
+import base64
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Set, Tuple
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, asdict
 import threading
 
+import msgpack
+from cachetools import TTLCache
 from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
-from motor.motor_asyncio import AsyncIOMotorClient
+from fastapi.responses import ORJSONResponse
+from pymongo import MongoClient
+from pymongo.write_concern import WriteConcern
 from pymongo.errors import PyMongoError
 import redis.asyncio as redis
 
@@ -34,36 +36,62 @@ MONGO_URI = os.getenv("MONGO_URI", "mongodb://mongo:27017/assessmentdb")
 REDIS_URI = os.getenv("REDIS_URI", "redis://redis:6379/0")
 APP_PORT = int(os.getenv("APP_PORT", "8000"))
 CACHE_TTL = int(os.getenv("CACHE_TTL", "300"))  # 5 minute cache TTL
+CACHE_REFRESH_RATIO = float(os.getenv("CACHE_REFRESH_RATIO", "0.8"))  # Refresh reads early at 80% of TTL
 MAX_QUEUE_SIZE = int(os.getenv("MAX_QUEUE_SIZE", "100000"))
+QUEUE_TRIM_SLACK = int(os.getenv("QUEUE_TRIM_SLACK", "1000"))  # Overshoot allowed before trimming
 BATCH_SIZE = int(os.getenv("BATCH_SIZE", "100"))  # Batch 100 writes at a time
+MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", "1000"))  # Batch ceiling (docs) while the queue is backed up
 BATCH_TIMEOUT_MS = int(os.getenv("BATCH_TIMEOUT_MS", "100"))  # Max wait for batch
 WRITE_WORKERS = int(os.getenv("WRITE_WORKERS", "4"))  # Background write workers
+MONGO_THREADS = int(os.getenv("MONGO_THREADS", "32"))  # Threads for blocking PyMongo calls
+WRITE_COALESCE_MS = float(os.getenv("WRITE_COALESCE_MS", "2"))  # Window for coalescing queued writes
+QUEUE_WRITE_TIMEOUT = float(os.getenv("QUEUE_WRITE_TIMEOUT", "5"))  # Max wait for the coalescer (seconds)
 
 # Global state
-mongo_client: Optional[AsyncIOMotorClient] = None
+mongo_client: Optional[MongoClient] = None
 db = None
 col = None
+writer_col = None  # Same collection with a primary-only write concern for queued writes
 redis_client: Optional[redis.Redis] = None
 write_queue_task = None
 
-# In-memory cache for ultra-fast reads (fallback when Redis is slow)
-local_cache: Dict[str, Any] = {}
-local_cache_timestamps: Dict[str, float] = {}
+# PyMongo calls run here directly, skipping Motor's wrapper layer.
+# Created and shut down in lifespan alongside mongo_client.
+mongo_pool: Optional[ThreadPoolExecutor] = None
 
-STREAM_KEY = "write_queue"
-CONSUMER_GROUP = "write_workers"
+# In-memory cache for ultra-fast reads (fallback when Redis is slow).
+# Entries are (value, cached_at) tuples; expiry and eviction are handled by TTLCache.
+local_cache: TTLCache = TTLCache(maxsize=1024, ttl=CACHE_TTL)
 
+# Requests waiting on the write coalescer: (future, write_docs) per request.
+# Both are (re)created in lifespan so they bind to the serving event loop.
+_pending_writes: List[Tuple[asyncio.Future, List[Dict]]] = []
+_pending_writes_event: Optional[asyncio.Event] = None
 
-def random_payload(size: int = 512) -> str:
-    """Generate a random payload of specified size."""
-    return "".join(random.choices(string.ascii_letters + string.digits, k=size))
+# In-flight MongoDB read refreshes, so concurrent cache misses share one query
+_inflight: Dict[str, asyncio.Task] = {}
 
+QUEUE_LIST = "write_queue"
+WRITES_PER_REQUEST = 5  # Docs per /api/data call; each queue entry holds one request's docs
+READ_CACHE_KEY = "api:data:reads"
 
-def generate_write_id() -> str:
-    """Generate unique write ID."""
-    return hashlib.sha256(
-        f"{time.time()}{random.random()}".encode()
-    ).hexdigest()[:16]
+
+def random_payloads(count: int, size: int = 512) -> List[str]:
+    """Generate count random payloads of specified size from one urandom call."""
+    encoded = base64.b64encode(os.urandom((count * size * 3) // 4 + 3)).decode()
+    return [encoded[i * size:(i + 1) * size] for i in range(count)]
+
+
+def generate_write_ids(count: int) -> List[str]:
+    """Generate count unique write IDs from one urandom call."""
+    raw = os.urandom(8 * count).hex()
+    return [raw[i * 16:(i + 1) * 16] for i in range(count)]
+
+
+async def run_mongo(fn, *args, **kwargs):
+    """Run a blocking PyMongo call on the Mongo thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(mongo_pool, functools.partial(fn, *args, **kwargs))
 
 
 async def get_redis() -> Optional[redis.Redis]:
@@ -74,7 +102,7 @@ async def get_redis() -> Optional[redis.Redis]:
             redis_client = redis.from_url(
                 REDIS_URI,
                 encoding="utf-8",
-                decode_responses=True,
+                decode_responses=False,  # Queue entries are raw msgpack bytes
                 socket_connect_timeout=5,
                 socket_timeout=5,
                 max_connections=200,
@@ -87,48 +115,87 @@ async def get_redis() -> Optional[redis.Redis]:
     return redis_client
 
 
-async def ensure_consumer_group():
-    """Ensure Redis Streams consumer group exists."""
-    r = await get_redis()
-    if r is None:
+async def push_write_batches(batches: List[List[Dict]]) -> None:
+    """Queue request batches to Redis in one round-trip."""
+    try:
+        r = await get_redis()
+        if r:
+            # One list entry per request carries its whole batch
+            queue_length = await r.lpush(
+                QUEUE_LIST,
+                *[msgpack.packb(write_docs, datetime=True) for write_docs in batches],
+            )
+            # Only trim once the cap is exceeded, dropping the oldest entries first
+            if queue_length > MAX_QUEUE_SIZE + QUEUE_TRIM_SLACK:
+                await r.ltrim(QUEUE_LIST, 0, MAX_QUEUE_SIZE - 1)
+    except Exception as e:
+        print(f"[queue] failed to queue writes: {e}")
+
+
+async def flush_pending_writes() -> None:
+    """Queue all pending request batches to Redis in one round-trip."""
+    global _pending_writes
+    
+    batch, _pending_writes = _pending_writes, []
+    if not batch:
         return
+    
     try:
-        await r.xgroup_create(STREAM_KEY, CONSUMER_GROUP, id="0", mkstream=True)
-    except redis.ResponseError as e:
-        if "already exists" not in str(e):
-            raise
+        await push_write_batches([write_docs for _, write_docs in batch])
+    finally:
+        for fut, _ in batch:
+            if not fut.done():
+                fut.set_result(None)
+
+
+async def write_coalescer():
+    """Background task that flushes queued writes after a short coalescing window."""
+    try:
+        while True:
+            await _pending_writes_event.wait()
+            await asyncio.sleep(WRITE_COALESCE_MS / 1000)
+            _pending_writes_event.clear()
+            await flush_pending_writes()
+    except asyncio.CancelledError:
+        await flush_pending_writes()
+        raise
 
 
 async def queue_writes(write_docs: List[Dict]) -> List[str]:
-    """Queue writes to Redis Stream for async processing."""
-    r = await get_redis()
-    write_ids = []
+    """Queue writes to Redis for async processing."""
+    write_ids = generate_write_ids(len(write_docs))
+    queued_at = time.time()
     
-    for doc in write_docs:
-        write_id = generate_write_id()
+    for doc, write_id in zip(write_docs, write_ids):
         doc["_write_id"] = write_id
-        doc["_queued_at"] = time.time()
-        
-        if r:
-            try:
-                await r.xadd(STREAM_KEY, {"data": json.dumps(doc)}, maxlen=MAX_QUEUE_SIZE)
-            except Exception as e:
-                print(f"[queue] failed to queue write: {e}")
-        
-        write_ids.append(write_id)
+        doc["_queued_at"] = queued_at
+    
+    # Without a running coalescer, push directly rather than wait on it
+    if write_queue_task is None or write_queue_task.done():
+        await push_write_batches([write_docs])
+        return write_ids
+    
+    # Hand off to the coalescer, which pushes concurrent requests together
+    fut = asyncio.get_running_loop().create_future()
+    _pending_writes.append((fut, write_docs))
+    _pending_writes_event.set()
+    try:
+        await asyncio.wait_for(fut, QUEUE_WRITE_TIMEOUT)
+    except asyncio.TimeoutError:
+        print("[queue] timed out waiting for write coalescer")
     
     return write_ids
 
 
 async def get_cached_reads() -> Optional[List[str]]:
     """Get cached read results from Redis or local cache."""
-    cache_key = "api:data:reads"
-    now = time.time()
+    cache_key = READ_CACHE_KEY
     
     # Check local cache first (fastest)
-    if cache_key in local_cache:
-        if now - local_cache_timestamps.get(cache_key, 0) < CACHE_TTL:
-            return local_cache[cache_key]
+    try:
+        return local_cache[cache_key][0]
+    except KeyError:
+        pass
     
     # Check Redis cache
     r = await get_redis()
@@ -136,10 +203,9 @@ async def get_cached_reads() -> Optional[List[str]]:
         try:
             cached = await r.get(cache_key)
             if cached:
-                data = json.loads(cached)
+                data = [read or None for read in cached.decode().split("\0")]
                 # Update local cache
-                local_cache[cache_key] = data
-                local_cache_timestamps[cache_key] = now
+                local_cache[cache_key] = (data, time.time())
                 return data
         except Exception as e:
             print(f"[cache] get error: {e}")
@@ -149,43 +215,97 @@ async def get_cached_reads() -> Optional[List[str]]:
 
 async def set_cached_reads(reads: List[str]) -> None:
     """Cache read results in both Redis and local cache."""
-    cache_key = "api:data:reads"
-    now = time.time()
+    cache_key = READ_CACHE_KEY
     
     # Update local cache
-    local_cache[cache_key] = reads
-    local_cache_timestamps[cache_key] = now
+    local_cache[cache_key] = (reads, time.time())
     
     # Update Redis cache
     r = await get_redis()
     if r:
         try:
-            await r.setex(cache_key, CACHE_TTL, json.dumps(reads))
+            # Reads are a fixed list of ID strings; skip JSON for a NUL-joined string
+            await r.setex(cache_key, CACHE_TTL, "\0".join(read or "" for read in reads))
         except Exception as e:
             print(f"[cache] set error: {e}")
 
 
+def cached_reads_stale() -> bool:
+    """Check whether locally cached reads are due for an early refresh."""
+    entry = local_cache.get(READ_CACHE_KEY)
+    if entry is None:
+        return False
+    return time.time() - entry[1] >= CACHE_TTL * CACHE_REFRESH_RATIO
+
+
+async def fetch_reads() -> List[Optional[str]]:
+    """Fetch read results from MongoDB and cache them."""
+    if col is None:
+        return [None] * 5
+    
+    try:
+        docs = await run_mongo(lambda: list(col.find({"type": "write"}).limit(5)))
+        reads = [str(doc["_id"]) for doc in docs]
+        while len(reads) < 5:
+            reads.append(None)
+        await set_cached_reads(reads)
+        return reads
+    except Exception as e:
+        print(f"[api] read error: {e}")
+        return [None] * 5
+
+
+def refresh_reads() -> asyncio.Task:
+    """Start a MongoDB read refresh, or join the one already in flight."""
+    task = _inflight.get(READ_CACHE_KEY)
+    if task is None:
+        task = asyncio.create_task(fetch_reads())
+        _inflight[READ_CACHE_KEY] = task
+        task.add_done_callback(lambda _: _inflight.pop(READ_CACHE_KEY, None))
+    return task
+
+
 async def process_write_batch(docs: List[Dict]):
     """Process a batch of writes to MongoDB."""
-    if not docs or col is None:
+    if not docs or writer_col is None:
         return
     
     try:
-        # Remove internal fields before inserting
-        clean_docs = []
+        # Strip internal fields in place before inserting
         for doc in docs:
-            clean_doc = {k: v for k, v in doc.items() if not k.startswith("_")}
-            clean_docs.append(clean_doc)
+            doc.pop("_write_id", None)
+            doc.pop("_queued_at", None)
         
-        if clean_docs:
-            result = await col.insert_many(clean_docs, ordered=False)
-            print(f"[writer] batch inserted {len(result.inserted_ids)} docs")
+        result = await run_mongo(
+            writer_col.insert_many, docs, ordered=False, bypass_document_validation=True
+        )
+        print(f"[writer] batch inserted {len(result.inserted_ids)} docs")
     except PyMongoError as e:
         print(f"[writer] batch insert error: {e}")
 
 
+def unpack_write_batch(item: bytes) -> Optional[List[Dict]]:
+    """Decode one queue entry into its docs, or None if it is malformed."""
+    try:
+        # Timestamps unpack straight to UTC datetimes (BSON dates)
+        docs = msgpack.unpackb(item, timestamp=3)
+    except (ValueError, TypeError):
+        return None
+    if not isinstance(docs, list) or not all(isinstance(doc, dict) for doc in docs):
+        return None
+    return docs
+
+
+def batch_limit_for(queue_depth: int) -> int:
+    """Docs per MongoDB batch, growing toward MAX_BATCH_SIZE while a backlog is queued."""
+    backlog_docs = queue_depth * WRITES_PER_REQUEST
+    if backlog_docs >= BATCH_SIZE:
+        return max(BATCH_SIZE, min(MAX_BATCH_SIZE, backlog_docs))
+    return BATCH_SIZE
+
+
 async def write_worker(worker_id: int):
-    """Background worker that processes writes from Redis Stream."""
+    """Background worker that processes writes from the Redis queue."""
     print(f"[worker-{worker_id}] started")
     r = await get_redis()
     
@@ -193,45 +313,59 @@ async def write_worker(worker_id: int):
         print(f"[worker-{worker_id}] no Redis connection, exiting")
         return
     
-    await ensure_consumer_group()
-    
-    consumer_name = f"worker-{worker_id}"
     pending_batch = []
     last_batch_time = time.time()
+    queue_depth = 0
     
     while True:
         try:
-            # Read from stream with timeout
-            messages = await r.xreadgroup(
-                CONSUMER_GROUP,
-                consumer_name,
-                {STREAM_KEY: ">"},
-                count=BATCH_SIZE,
-                block=1000
-            )
+            # Pop enough entries to fill the current batch limit, reading the
+            # remaining queue depth in the same round-trip. Only BRPOP and
+            # RPOP with a count are used so any Redis-protocol server works.
+            batch_limit = batch_limit_for(queue_depth)
+            pop_count = max(1, -(-(batch_limit - len(pending_batch)) // WRITES_PER_REQUEST))
+            async with r.pipeline(transaction=False) as pipe:
+                if pending_batch:
+                    # Don't block past the pending batch's deadline
+                    pipe.rpop(QUEUE_LIST, pop_count)
+                else:
+                    # Block for the first entry, then take the rest without blocking
+                    pipe.brpop(QUEUE_LIST, timeout=1)
+                    if pop_count > 1:
+                        pipe.rpop(QUEUE_LIST, pop_count - 1)
+                pipe.llen(QUEUE_LIST)
+                results = await pipe.execute()
+            
+            queue_depth = results[-1]
+            if pending_batch:
+                items = results[0] or []
+            else:
+                first = results[0]
+                items = [first[1]] if first else []
+                if pop_count > 1:
+                    items.extend(results[1] or [])
             
-            if messages:
-                for stream_name, msgs in messages:
-                    for msg_id, fields in msgs:
-                        try:
-                            doc = json.loads(fields.get("data", "{}"))
-                            doc["_msg_id"] = msg_id
-                            pending_batch.append(doc)
-                        except json.JSONDecodeError:
-                            print(f"[worker-{worker_id}] invalid JSON in message")
+            if items:
+                if not pending_batch:
+                    # BATCH_TIMEOUT_MS bounds how long the oldest doc waits
+                    last_batch_time = time.time()
+                for item in items:
+                    docs = unpack_write_batch(item)
+                    if docs is None:
+                        print(f"[worker-{worker_id}] invalid msgpack in message")
+                    else:
+                        pending_batch.extend(docs)
+            elif pending_batch:
+                # Queue is empty; wait briefly before polling again
+                remaining = BATCH_TIMEOUT_MS / 1000 - (time.time() - last_batch_time)
+                await asyncio.sleep(min(0.01, max(0.0, remaining)))
             
             # Check if we should flush the batch
-            batch_full = len(pending_batch) >= BATCH_SIZE
+            batch_full = len(pending_batch) >= batch_limit_for(queue_depth)
             timeout_reached = (time.time() - last_batch_time) * 1000 >= BATCH_TIMEOUT_MS
             
             if pending_batch and (batch_full or timeout_reached):
                 await process_write_batch(pending_batch)
-                
-                # Acknowledge processed messages
-                msg_ids = [doc.get("_msg_id") for doc in pending_batch if "_msg_id" in doc]
-                if msg_ids:
-                    await r.xack(STREAM_KEY, CONSUMER_GROUP, *msg_ids)
-                
                 pending_batch = []
                 last_batch_time = time.time()
         
@@ -249,14 +383,17 @@ async def write_worker(worker_id: int):
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager for startup/shutdown."""
-    global mongo_client, db, col, write_queue_task
+    global mongo_client, db, col, writer_col, write_queue_task, mongo_pool
+    global _pending_writes, _pending_writes_event
     
     print("[startup] initializing...")
     
+    mongo_pool = ThreadPoolExecutor(max_workers=MONGO_THREADS, thread_name_prefix="mongo")
+    
     # Connect to MongoDB
     for attempt in range(1, 11):
         try:
-            mongo_client = AsyncIOMotorClient(
+            mongo_client = MongoClient(
                 MONGO_URI,
                 serverSelectionTimeoutMS=5000,
                 connectTimeoutMS=10000,
@@ -267,9 +404,14 @@ async def lifespan(app: FastAPI):
                 retryWrites=True,
                 w="majority",
             )
-            await mongo_client.admin.command("ping")
+            await run_mongo(mongo_client.admin.command, "ping")
             db = mongo_client["assessmentdb"]
             col = db["records"]
+            # Queued writes are already decoupled from requests; skip the
+            # majority ack and journal wait on their bulk inserts
+            writer_col = db.get_collection(
+                "records", write_concern=WriteConcern(w=1, j=False)
+            )
             print(f"[mongo] connected on attempt {attempt}")
             break
         except Exception as e:
@@ -281,9 +423,11 @@ async def lifespan(app: FastAPI):
     
     # Initialize Redis
     await get_redis()
-    await ensure_consumer_group()
     
-    # Start background write workers
+    # Start write coalescer and background write workers
+    _pending_writes = []
+    _pending_writes_event = asyncio.Event()
+    write_queue_task = asyncio.create_task(write_coalescer())
     worker_tasks = []
     for i in range(WRITE_WORKERS):
         task = asyncio.create_task(write_worker(i))
@@ -295,15 +439,20 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     print("[shutdown] stopping workers...")
-    for task in worker_tasks:
+    for task in [write_queue_task, *worker_tasks]:
         task.cancel()
         try:
             await task
         except asyncio.CancelledError:
             pass
+        except Exception as e:
+            print(f"[shutdown] background task failed: {e}")
+    write_queue_task = None
     
     if mongo_client:
         mongo_client.close()
+    mongo_pool.shutdown(wait=False)
+    mongo_pool = None
     if redis_client:
         await redis_client.close()
     
@@ -314,6 +463,7 @@ app = FastAPI(
     title="DevOps Assessment API - High Performance",
     version="3.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -334,7 +484,7 @@ async def readiness_check():
         raise HTTPException(status_code=503, detail="MongoDB not connected")
     
     try:
-        await mongo_client.admin.command("ping")
+        await run_mongo(mongo_client.admin.command, "ping")
         r = await get_redis()
         return {
             "status": "ready",
@@ -351,8 +501,9 @@ async def process_data():
     Assessment endpoint - performs 5 reads + 5 writes per request.
     
     Optimizations:
-    - Writes are queued to Redis Stream and processed asynchronously
+    - Writes are queued to Redis and processed asynchronously
     - Reads are heavily cached with 5-minute TTL
+    - Cache misses are coalesced into a single MongoDB query
     - Returns immediately after queueing writes (no DB wait)
     """
     # Get cached reads first
@@ -360,45 +511,32 @@ async def process_data():
     
     if cached_reads:
         reads = cached_reads
+        if cached_reads_stale():
+            # Refresh in the background before the entry expires
+            refresh_reads()
     else:
-        # Cache miss - fetch from MongoDB if available
-        if col:
-            try:
-                reads = []
-                cursor = col.find({"type": "write"}).limit(5)
-                async for doc in cursor:
-                    reads.append(str(doc["_id"]))
-                while len(reads) < 5:
-                    reads.append(None)
-                await set_cached_reads(reads)
-            except Exception as e:
-                print(f"[api] read error: {e}")
-                reads = [None] * 5
-        else:
-            reads = [None] * 5
-    
-    # Prepare write documents
+        # Cache miss - concurrent requests share a single MongoDB fetch
+        reads = await asyncio.shield(refresh_reads())
+    
+    # Prepare write documents from a shared template
+    now = datetime.utcnow()
+    base_doc = {"type": "write", "timestamp": now.replace(tzinfo=timezone.utc)}
     write_docs = [
-        {
-            "type": "write",
-            "index": i,
-            "payload": random_payload(),
-            "timestamp": datetime.utcnow().isoformat(),
-        }
-        for i in range(5)
+        {**base_doc, "index": i, "payload": payload}
+        for i, payload in enumerate(random_payloads(WRITES_PER_REQUEST))
     ]
     
     # Queue writes for async processing (returns immediately)
     write_ids = await queue_writes(write_docs)
     
-    return JSONResponse(content={
+    return {
         "status": "success",
         "reads": reads,
         "writes": write_ids,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": now.isoformat(),
         "cached": cached_reads is not None,
         "queued": True
-    })
+    }
 
 
 @app.get("/api/stats")
@@ -408,7 +546,7 @@ async def get_stats():
         raise HTTPException(status_code=503, detail="MongoDB not reachable")
     
     try:
-        count = await col.count_documents({})
+        count = await run_mongo(col.count_documents, {})
         return {"total_documents": count, "timestamp": datetime.utcnow().isoformat()}
     except PyMongoError as exc:
         raise HTTPException(status_code=500, detail=str(exc))
@@ -423,15 +561,13 @@ async def cache_status():
     
     try:
         info = await r.info()
-        stream_info = await r.xinfo_stream(STREAM_KEY)
-        group_info = await r.xinfo_groups(STREAM_KEY)
+        queue_length = await r.llen(QUEUE_LIST)
         
         return {
             "redis_connected": True,
             "used_memory": info.get("used_memory_human", "unknown"),
             "connected_clients": info.get("connected_clients", "unknown"),
-            "queue_length": stream_info.get("length", 0),
-            "consumer_groups": len(group_info),
+            "queue_length": queue_length,
             "local_cache_size": len(local_cache),
         }
     except Exception as e:
@@ -441,18 +577,23 @@ async def cache_status():
 @app.post("/api/admin/flush-cache")
 async def flush_cache():
     """Admin endpoint to flush caches."""
-    global local_cache, local_cache_timestamps
-    
     local_cache.clear()
-    local_cache_timestamps.clear()
     
     r = await get_redis()
     if r:
-        await r.delete("api:data:reads")
+        await r.delete(READ_CACHE_KEY)
     
     return {"status": "cache flushed"}
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=APP_PORT)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=APP_PORT,
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count(),
+        access_log=False,
+    )
@@ -6,11 +6,11 @@ Consumes from Redis queue and batches inserts to MongoDB.
 
 import os
 import time
-import json
 import signal
 import sys
 from datetime import datetime
 
+import msgpack
 import redis
 from pymongo import MongoClient
 from pymongo.errors import PyMongoError
@@ -57,7 +57,7 @@ def connect_redis():
         r = redis.Redis(
             host=REDIS_HOST,
             port=REDIS_PORT,
-            decode_responses=True,
+            decode_responses=False,  # Queue entries are raw msgpack bytes
             socket_connect_timeout=5
         )
         r.ping()
@@ -96,19 +96,33 @@ def main():
             pipeline.ltrim(QUEUE_LIST, BATCH_SIZE, -1)
             results = pipeline.execute()
             
-            items = results[0]  # List of JSON strings
+            items = results[0]  # List of msgpack-encoded document batches
             
             if not items:
                 time.sleep(0.1)
                 continue
             
-            # Parse and insert documents
-            docs = [json.loads(item) for item in items]
+            # Parse and insert documents (each queue entry holds one request's batch).
+            # Entries are already trimmed off the queue, so skip bad ones individually.
+            docs = []
+            for item in items:
+                try:
+                    batch = msgpack.unpackb(item, timestamp=3)
+                except (ValueError, TypeError):
+                    batch = None
+                if not isinstance(batch, list) or not all(isinstance(doc, dict) for doc in batch):
+                    print("[worker] Skipping invalid queue entry")
+                    stats["errors"] += 1
+                    continue
+                docs.extend(batch)
             
             if docs:
-                # Add processing timestamp
+                # Strip internal queue fields and store timestamps as BSON dates
+                processed_at = datetime.utcnow()
                 for doc in docs:
-                    doc["processed_at"] = datetime.utcnow().isoformat()
+                    doc.pop("_write_id", None)
+                    doc.pop("_queued_at", None)
+                    doc["processed_at"] = processed_at
                 
                 # Bulk insert
                 result = mongo_col.insert_many(docs, ordered=False)